@@ -4,6 +4,7 @@ ACM Agent Runner
 Entry point for the ACM chatbot application
 """
 
+import logging
 import sys
 import os
 
@@ -11,5 +12,11 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 if __name__ == "__main__":
+    # ACM_LOG_LEVEL applies to the agent logger only; libraries such as httpx
+    # stay at WARNING so they do not log every request. Level names are
+    # case-insensitive; unknown names fall back to INFO.
+    logging.basicConfig(level=logging.WARNING)
+    log_level = os.getenv("ACM_LOG_LEVEL", "INFO").upper()
+    logging.getLogger("acm_agent").setLevel(log_level if log_level in logging.getLevelNamesMapping() else "INFO")
     from src.app import main
     main()
\ No newline at end of file
@@ -1,15 +1,157 @@
 import asyncio
+import atexit
+import functools
+import json
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, Union
 from dataclasses import dataclass
 
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+import httpx
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage, trim_messages
+from langchain_core.messages.utils import count_tokens_approximately
 from langchain.chat_models import init_chat_model
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
+from langchain_core.runnables import RunnableConfig
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.graph import StateGraph, MessagesState, START, END
-from langgraph.prebuilt import ToolNode
+from langgraph.graph.state import CompiledStateGraph
+
+logger = logging.getLogger("acm_agent")
+
+# Tool results and model messages longer than this are truncated in debug logs
+LOG_TRUNCATE_CHARS = 500
+
+# Seconds a cached MCP client and its tool list are reused before reconnecting
+MCP_CACHE_TTL = 600
+
+# MCP clients and tool lists shared across agents, keyed by (server url, bearer token)
+_MCP_CLIENT_CACHE: Dict[Tuple[str, str], Tuple[float, MultiServerMCPClient, List]] = {}
+
+# Compiled graphs shared across agents, keyed by whether the graph has a tool node
+_GRAPH_CACHE: Dict[Tuple[bool], CompiledStateGraph] = {}
+
+# Yielded by ACMSearchAgent.chat_stream when the text streamed since the last
+# turn belonged to a model turn that ended in tool calls and should be discarded
+STREAM_RESET = object()
+
+# Number of tool results remembered per agent session
+TOOL_RESULT_CACHE_SIZE = 128
+
+# Seconds a cached tool result is reused before the MCP server is queried again
+TOOL_RESULT_CACHE_TTL = 60
+
+# Providers only cache prompt prefixes of at least this many tokens
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# Deterministic footer used to pad short system prompts up to PROMPT_CACHE_MIN_TOKENS
+PROMPT_CACHE_PADDING_HEADER = "\n\nThe lines below only pad this prompt and carry no instructions.\n"
+PROMPT_CACHE_PADDING_LINE = "This line is padding and can be ignored.\n"
+
+# Used when acm_system_prompt.txt cannot be read
+FALLBACK_SYSTEM_PROMPT = """
+        You are an ACM (Advanced Cluster Management) assistant that helps users search and find information about their Red Hat OpenShift clusters and resources.
+
+        CRITICAL DATABASE SCHEMA KNOWLEDGE:
+        - Main table: search.resources with columns: uid (text), cluster (text), data (jsonb)
+        - ALL resource information is stored in the 'data' JSONB column
+        - Always explore the data structure before making assumptions
+
+        CRITICAL: NEVER HALLUCINATE MISSING DATA
+        - If data fields are missing, explicitly state the limitation
+        - Never assume "no field = feature disabled"
+        - Always be honest about data completeness
+
+        IMPORTANT: Always discover the actual data structure first using:
+        SELECT jsonb_pretty(data) FROM search.resources WHERE data->>'kind' = 'ResourceType' LIMIT 1;
+        """
+
+
+# Process-wide event loop that runs every agent, see get_agent_loop()
+_AGENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_AGENT_LOOP_LOCK = threading.Lock()
+
+
+def get_agent_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide agent event loop, started once in a background thread
+
+    All agents share this one loop, so the module-level caches (MCP clients,
+    compiled graphs, LLM cache) and provider keep-alive sockets are only used
+    from a single event loop. It lives here rather than in a Streamlit cache
+    so clearing that cache or re-running the UI script never starts another.
+    """
+    global _AGENT_LOOP
+    with _AGENT_LOOP_LOCK:
+        if _AGENT_LOOP is None:
+            _AGENT_LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_AGENT_LOOP.run_forever, name="acm-agent-loop", daemon=True).start()
+            atexit.register(_AGENT_LOOP.call_soon_threadsafe, _AGENT_LOOP.stop)
+        return _AGENT_LOOP
+
+
+def invalidate_mcp_cache():
+    """Drop cached MCP clients so the next agent reconnects and re-lists tools"""
+    _MCP_CLIENT_CACHE.clear()
+
+
+def create_mcp_http_client(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None
+) -> httpx.AsyncClient:
+    """Create the httpx client used for MCP sessions, with HTTP/2 and keep-alive pooling"""
+    return httpx.AsyncClient(
+        http2=True,
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0, connect=5.0),
+        auth=auth,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        follow_redirects=True
+    )
+
+
+def _pad_for_prompt_cache(prompt: str) -> str:
+    """Pad the prompt past the provider prompt-cache minimum with a fixed footer"""
+    if count_tokens_approximately([prompt]) >= PROMPT_CACHE_MIN_TOKENS:
+        return prompt
+    logger.warning("System prompt is below %d tokens, padding it for prompt caching", PROMPT_CACHE_MIN_TOKENS)
+    prompt += PROMPT_CACHE_PADDING_HEADER
+    while count_tokens_approximately([prompt]) < PROMPT_CACHE_MIN_TOKENS:
+        prompt += PROMPT_CACHE_PADDING_LINE
+    return prompt
+
+
+@functools.lru_cache(maxsize=1)
+def _load_system_prompt_cached(path: str) -> str:
+    """Read the system prompt file, memoizing the result (or the fallback)"""
+    try:
+        prompt = Path(path).read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
+        logger.warning("Could not find prompt file at %s", path)
+        prompt = FALLBACK_SYSTEM_PROMPT
+    except Exception as e:
+        logger.warning("Could not load prompt file: %s", e)
+        prompt = FALLBACK_SYSTEM_PROMPT
+    return _pad_for_prompt_cache(prompt)
+
+
+# Graph nodes look up the agent for the current run in config["configurable"],
+# so one compiled graph can serve every ACMSearchAgent instance
+async def _call_model_node(state: MessagesState, config: RunnableConfig):
+    return await config["configurable"]["agent"].call_model(state)
+
+
+async def _tool_node(state: MessagesState, config: RunnableConfig):
+    return await config["configurable"]["agent"].tool_node(state)
+
+
+def _should_continue(state: MessagesState, config: RunnableConfig):
+    return config["configurable"]["agent"].should_continue(state)
 
 
 @dataclass
@@ -19,10 +161,11 @@ class ACMAgentConfig:
     model_provider: str = "openai"
     model_name: str = "gpt-4o"
     temperature: float = 0.01
+    max_context_tokens: int = 8000
 
     # MCP Configuration
     mcp_server_url: str = ""
-    mcp_transport: str = "sse"
+    mcp_transport: str = "streamable_http"
     mcp_bearer_token: str = ""
 
     @classmethod
@@ -34,10 +177,11 @@ class ACMAgentConfig:
             model_provider=os.getenv("MODEL_PROVIDER", "openai"),
             model_name=os.getenv("MODEL_NAME", "gpt-4o"),
             temperature=float(os.getenv("MODEL_TEMPERATURE", "0.01")),
+            max_context_tokens=int(os.getenv("MAX_CONTEXT_TOKENS", "8000")),
 
             # MCP settings
             mcp_server_url=os.getenv("MCP_SERVER_URL", ""),
-            mcp_transport=os.getenv("MCP_TRANSPORT", "sse"),
+            mcp_transport=os.getenv("MCP_TRANSPORT", "streamable_http"),
             mcp_bearer_token=os.getenv("MCP_BEARER_TOKEN", "")
         )
 
@@ -50,10 +194,12 @@ class ACMAgentConfig:
         return {
             "acm-search": {
                 "url": self.mcp_server_url,
-                "transport": self.mcp_transport,
+                # Accept both "streamable-http" and the adapter's "streamable_http"
+                "transport": self.mcp_transport.replace("-", "_"),
                 "headers": {
                     "Authorization": f"Bearer {self.mcp_bearer_token}"
-                }
+                },
+                "httpx_client_factory": create_mcp_http_client
             }
         }
 
@@ -67,18 +213,26 @@ class ACMSearchAgent:
         self.model_with_tools = None
         self.tool_node = None
         self.graph = None
-        self.system_prompt = None  # Cache the system prompt
+        self._system_prompt = None  # Cache the system prompt, frozen once loaded
+        self._system_message = None  # Cache the SystemMessage built from the prompt
+        # Successful tool results keyed by (tool name, canonical JSON args)
+        self._tool_result_cache: OrderedDict[Tuple[str, str], Tuple[float, ToolMessage]] = OrderedDict()
+
+    @property
+    def system_prompt(self) -> Optional[str]:
+        """The loaded system prompt; read-only so the cached prompt prefix never changes"""
+        return self._system_prompt
 
     async def setup_mcp_connection(self):
         """Set up connection to MCP server and get available tools"""
         try:
-            print(f"🔧 Initializing {self.config.model_provider} model: {self.config.model_name}")
+            logger.debug("🔧 Initializing %s model: %s", self.config.model_provider, self.config.model_name)
 
             # Load and cache the system prompt (only once during initialization)
-            self.system_prompt = self.load_system_prompt()
-            print("📝 === LOADED SYSTEM PROMPT ===")
-            print(self.system_prompt)
-            print("📝 === END SYSTEM PROMPT ===")
+            if self._system_prompt is None:
+                self._system_prompt = self.load_system_prompt()
+            logger.debug("📝 === LOADED SYSTEM PROMPT ===\n%s\n📝 === END SYSTEM PROMPT ===", self.system_prompt)
+            self._system_message = self.build_system_message()
 
             # Initialize the model using configuration
             self.llm = init_chat_model(
@@ -87,90 +241,148 @@ class ACMSearchAgent:
                 temperature=self.config.temperature
             )
 
-            print(f"🔗 Attempting MCP connection to: {self.config.mcp_server_url}")
-            # Set up MCP client using configuration
-            mcp_config = self.config.get_mcp_config()
-            self.mcp_client = MultiServerMCPClient(mcp_config)
-
-            print("📡 Getting tools from MCP server...")
-            # Get tools from MCP server
-            self.tools = await self.mcp_client.get_tools()
-            print(f"✅ Connected to MCP server. Available tools: {[tool.name for tool in self.tools]}")
-
-            print("🔗 Binding tools to model...")
+            # Reuse a recent MCP client and tool list for the same server
+            cache_key = (self.config.mcp_server_url, self.config.mcp_bearer_token)
+            cached = _MCP_CLIENT_CACHE.get(cache_key)
+            if cached and time.monotonic() - cached[0] < MCP_CACHE_TTL:
+                _, self.mcp_client, self.tools = cached
+                logger.debug("♻️ Reusing MCP connection to: %s", self.config.mcp_server_url)
+            else:
+                logger.debug("🔗 Attempting MCP connection to: %s", self.config.mcp_server_url)
+                # Set up MCP client using configuration
+                mcp_config = self.config.get_mcp_config()
+                self.mcp_client = MultiServerMCPClient(mcp_config)
+
+                logger.debug("📡 Getting tools from MCP server...")
+                # Get tools from MCP server
+                self.tools = await self.mcp_client.get_tools()
+                _MCP_CLIENT_CACHE[cache_key] = (time.monotonic(), self.mcp_client, self.tools)
+            logger.debug("✅ Connected to MCP server. Available tools: %s", [tool.name for tool in self.tools])
+
+            logger.debug("🔗 Binding tools to model...")
             # Bind tools to model
             self.model_with_tools = self.llm.bind_tools(self.tools)
 
-            # Create ToolNode with custom wrapper for debugging
+            # Create tool node with debug logging and concurrent dispatch
             self.tool_node = self.create_debug_tool_node()
-            print(f"🎯 Created ToolNode with {len(self.tools)} tools")
+            logger.debug("🎯 Created tool node with %d tools", len(self.tools))
 
         except Exception as e:
-            print(f"Failed to connect to MCP server: {e}")
-            # Fallback to basic OpenAI model without tools
-            self.llm = ChatOpenAI(
-                api_key=self.config.openai_api_key,
-                model=self.config.model_name,
-                temperature=self.config.temperature
-            )
+            logger.error("Failed to connect to MCP server: %s", e)
+            # Fallback to the basic model without tools, reusing the client
+            # created above if the failure happened after model init
+            if self.llm is None:
+                self.llm = init_chat_model(
+                    self.config.get_model_string(),
+                    api_key=self.config.openai_api_key,
+                    temperature=self.config.temperature
+                )
+            self.model_with_tools = None
+            self.tool_node = None
             self.tools = []
 
+    async def _invoke_single_tool(self, tool_call: Dict[str, Any]) -> ToolMessage:
+        """Run one tool call against the MCP server and return its ToolMessage"""
+        tool = next((t for t in self.tools if t.name == tool_call['name']), None)
+        if tool is None:
+            return ToolMessage(
+                content=f"Error: unknown tool '{tool_call['name']}'",
+                tool_call_id=tool_call['id'],
+                status="error"
+            )
+        # Invoking with the full tool call returns a ToolMessage that keeps the
+        # MCP adapter's artifact and the matching tool_call_id
+        return await tool.ainvoke({**tool_call, "type": "tool_call"})
+
     def create_debug_tool_node(self):
-        """Create a ToolNode with debug printing"""
+        """Create a tool node with debug logging that runs tool calls concurrently"""
         async def debug_tool_execution(state: MessagesState):
             messages = state["messages"]
             last_message = messages[-1]
+            tool_calls = getattr(last_message, 'tool_calls', None) or []
+
+            for tool_call in tool_calls:
+                logger.debug("🔧 Tool called: %s", tool_call['name'])
+                logger.debug("📝 Tool args: %s", tool_call['args'])
+
+            # Group identical calls so each distinct (name, args) pair runs once
+            keys = [(tc['name'], json.dumps(tc['args'], sort_keys=True)) for tc in tool_calls]
+            unique_calls = {}
+            for key, tool_call in zip(keys, tool_calls):
+                unique_calls.setdefault(key, tool_call)
+
+            results = {}
+            pending = []
+            for key, tool_call in unique_calls.items():
+                cached = self._tool_result_cache.get(key)
+                if cached and time.monotonic() - cached[0] < TOOL_RESULT_CACHE_TTL:
+                    self._tool_result_cache.move_to_end(key)
+                    results[key] = cached[1]
+                    logger.debug("♻️ Reusing cached result for: %s", tool_call['name'])
+                else:
+                    pending.append((key, tool_call))
+
+            # Execute independent tool calls concurrently
+            outcomes = await asyncio.gather(
+                *(self._invoke_single_tool(tool_call) for _, tool_call in pending),
+                return_exceptions=True
+            )
 
-            if hasattr(last_message, 'tool_calls') and last_message.tool_calls:
-                for tool_call in last_message.tool_calls:
-                    print(f"🔧 Tool called: {tool_call['name']}")
-                    print(f"📝 Tool args: {tool_call['args']}")
-
-            # Execute the actual tools
-            tool_node = ToolNode(self.tools)
-            result = await tool_node.ainvoke(state)
-
-            # Print tool results
-            if 'messages' in result:
-                for msg in result['messages']:
-                    if hasattr(msg, 'content'):
-                        print(f"📊 Tool result: {msg.content}")
-
-            return result
+            for (key, tool_call), result in zip(pending, outcomes):
+                # Propagate cancellation and other non-Exception errors unchanged
+                if isinstance(result, BaseException) and not isinstance(result, Exception):
+                    raise result
+                if isinstance(result, Exception):
+                    # Report the failure back to the model instead of aborting the graph
+                    result = ToolMessage(
+                        content=f"Error: {result}",
+                        tool_call_id=tool_call['id'],
+                        name=tool_call['name'],
+                        status="error"
+                    )
+                elif result.status != "error":
+                    self._tool_result_cache[key] = (time.monotonic(), result)
+                    self._tool_result_cache.move_to_end(key)
+                    if len(self._tool_result_cache) > TOOL_RESULT_CACHE_SIZE:
+                        self._tool_result_cache.popitem(last=False)
+                logger.debug("📊 Tool result: %.*s", LOG_TRUNCATE_CHARS, result.content)
+                results[key] = result
+
+            # Fan results back out, one ToolMessage per original tool call id
+            tool_messages = []
+            for key, tool_call in zip(keys, tool_calls):
+                tool_messages.append(results[key].model_copy(update={"tool_call_id": tool_call['id']}))
+
+            return {"messages": tool_messages}
 
         return debug_tool_execution
 
     def load_system_prompt(self):
-        """Load system prompt from external file"""
-        try:
-            prompt_file = Path(__file__).parent / "acm_system_prompt.txt"
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        except FileNotFoundError:
-            print(f"Warning: Could not find prompt file at {prompt_file}")
-            return self.get_fallback_prompt()
-        except Exception as e:
-            print(f"Warning: Could not load prompt file: {e}")
-            return self.get_fallback_prompt()
+        """Load system prompt from external file (read once per process)"""
+        return _load_system_prompt_cached(str(Path(__file__).parent / "acm_system_prompt.txt"))
 
     def get_fallback_prompt(self):
         """Fallback prompt if file loading fails"""
-        return """
-        You are an ACM (Advanced Cluster Management) assistant that helps users search and find information about their Red Hat OpenShift clusters and resources.
-
-        CRITICAL DATABASE SCHEMA KNOWLEDGE:
-        - Main table: search.resources with columns: uid (text), cluster (text), data (jsonb)
-        - ALL resource information is stored in the 'data' JSONB column
-        - Always explore the data structure before making assumptions
-
-        CRITICAL: NEVER HALLUCINATE MISSING DATA
-        - If data fields are missing, explicitly state the limitation
-        - Never assume "no field = feature disabled"
-        - Always be honest about data completeness
-
-        IMPORTANT: Always discover the actual data structure first using:
-        SELECT jsonb_pretty(data) FROM search.resources WHERE data->>'kind' = 'ResourceType' LIMIT 1;
-        """
+        return FALLBACK_SYSTEM_PROMPT
+
+    def build_system_message(self) -> SystemMessage:
+        """Build the system message so the provider can cache it as a stable prefix"""
+        if self.config.model_provider == "anthropic":
+            # Anthropic only caches blocks explicitly marked with cache_control
+            return SystemMessage(content=[{
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }])
+        # OpenAI caches prompt prefixes automatically, as long as the system
+        # message is always sent first with byte-identical text
+        return SystemMessage(content=self.system_prompt)
+
+    def log_cache_usage(self, response):
+        """Log prompt cache statistics reported by the provider"""
+        usage = getattr(response, "usage_metadata", None) or {}
+        cache_read = usage.get("input_token_details", {}).get("cache_read", 0)
+        logger.debug("💾 Prompt cache: %d/%d input tokens read from cache", cache_read, usage.get('input_tokens', 0))
 
     def get_loaded_system_prompt(self):
         """Get the currently loaded system prompt for debugging/display purposes"""
@@ -180,21 +392,42 @@ class ACMSearchAgent:
         """Determine if we should continue to tools or end"""
         messages = state["messages"]
         last_message = messages[-1]
-        print(f"Messages being exchanged: {last_message}")
+        logger.debug("Messages being exchanged: %.*s", LOG_TRUNCATE_CHARS, last_message)
         if last_message.tool_calls:
             return "tools"
         return END
 
+    def trim_context(self, messages: List) -> List:
+        """Bound the context sent to the model, keeping the system prompt and question pinned"""
+        # The system prompt stays byte-identical so provider prefix caching still hits
+        pinned, history = messages[:2], messages[2:]
+        if not history:
+            return messages
+
+        budget = self.config.max_context_tokens - count_tokens_approximately(pinned)
+        trimmed = trim_messages(
+            history,
+            max_tokens=max(budget, 0),
+            token_counter=count_tokens_approximately,
+            strategy="last",
+            start_on="ai",  # never keep tool results without the call that produced them
+            allow_partial=False
+        )
+        if not trimmed:
+            # Always keep the latest tool round so the model sees its newest results
+            last_ai = max(i for i, msg in enumerate(history) if isinstance(msg, AIMessage))
+            trimmed = history[last_ai:]
+        return [*pinned, *trimmed]
+
     async def call_model(self, state: MessagesState):
         """Call the model with current state"""
         messages = state["messages"]
 
-        # Add system message for ACM context (use cached prompt)
-        system_msg = SystemMessage(content=self.system_prompt)
-
-        # Insert system message at the beginning if not already there
+        # Insert the prebuilt system message at the beginning if not already there
         if not messages or not isinstance(messages[0], SystemMessage):
-            messages = [system_msg] + messages
+            messages = [self._system_message, *messages]
+
+        messages = self.trim_context(messages)
 
         if self.model_with_tools:
             response = await self.model_with_tools.ainvoke(messages)
@@ -202,19 +435,34 @@ class ACMSearchAgent:
             # Fallback to basic model
             response = await self.llm.ainvoke(messages)
 
+        self.log_cache_usage(response)
         return {"messages": [response]}
 
+    def clear_cache(self):
+        """Clear cached LLM responses and tool results so stale data is not replayed"""
+        llm_cache = get_llm_cache()
+        if llm_cache is not None:
+            llm_cache.clear()
+            logger.debug("🗑️ Cleared LLM response cache")
+        self._tool_result_cache.clear()
+
     def create_graph(self):
-        """Create the LangGraph workflow"""
+        """Create the LangGraph workflow, reusing a compiled graph with the same topology"""
+        has_tools = bool(self.tools and self.tool_node)
+        key = (has_tools,)
+        if key in _GRAPH_CACHE:
+            self.graph = _GRAPH_CACHE[key]
+            return
+
         builder = StateGraph(MessagesState)
-        builder.add_node("call_model", self.call_model)
+        builder.add_node("call_model", _call_model_node)
 
-        if self.tools and self.tool_node:
-            builder.add_node("tools", self.tool_node)
+        if has_tools:
+            builder.add_node("tools", _tool_node)
             builder.add_edge(START, "call_model")
             builder.add_conditional_edges(
                 "call_model",
-                self.should_continue,
+                _should_continue,
             )
             builder.add_edge("tools", "call_model")
         else:
@@ -222,13 +470,15 @@ class ACMSearchAgent:
             builder.add_edge(START, "call_model")
             builder.add_edge("call_model", END)
 
-        self.graph = builder.compile()
+        self.graph = _GRAPH_CACHE[key] = builder.compile()
+
+    def get_graph_config(self) -> RunnableConfig:
+        """Run config binding the shared graph's nodes to this agent"""
+        return {"configurable": {"agent": self}}
 
     async def chat(self, user_input: str) -> str:
         """Process a user input and return the agent's response"""
-        print(f"\n{'='*60}")
-        print(f"🚀 START OF QUESTION: {user_input}")
-        print(f"{'='*60}")
+        logger.debug("🚀 START OF QUESTION: %s", user_input)
 
         if not self.graph:
             await self.setup_mcp_connection()
@@ -238,21 +488,76 @@ class ACMSearchAgent:
         input_state = {"messages": [HumanMessage(content=user_input)]}
 
         # Run the graph
-        result = await self.graph.ainvoke(input_state)
+        result = await self.graph.ainvoke(input_state, config=self.get_graph_config())
 
         # Get the final response
         final_response = result["messages"][-1].content
 
-        print(f"\n{'='*60}")
-        print(f"✅ FINAL ANSWER: {final_response}")
-        print(f"{'='*60}\n")
+        logger.debug("✅ FINAL ANSWER: %.*s", LOG_TRUNCATE_CHARS, final_response)
 
         # Return the last message content
         return final_response
 
+    @staticmethod
+    def _text_content(content) -> str:
+        """Extract plain text from string or content-block message content"""
+        if isinstance(content, str):
+            return content
+        return "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content
+        )
+
+    async def chat_stream(self, user_input: str) -> AsyncIterator[Union[str, object]]:
+        """Process a user input and yield the agent's response text as it is generated
+
+        Model turns that end in tool calls may stream text first (e.g. "Let me
+        look that up"); once such a turn ends, STREAM_RESET is yielded so the
+        caller drops that text. What remains is the final answer, as in chat().
+        """
+        logger.debug("🚀 START OF QUESTION (streaming): %s", user_input)
+
+        if not self.graph:
+            await self.setup_mcp_connection()
+            self.create_graph()
+
+        # Create the input state
+        input_state = {"messages": [HumanMessage(content=user_input)]}
+
+        # Model runs that produced streamed tokens
+        streamed_runs = set()
+        async for event in self.graph.astream_events(
+            input_state, config=self.get_graph_config(), version="v2"
+        ):
+            if event["event"] == "on_chat_model_stream":
+                text = self._text_content(event["data"]["chunk"].content)
+                if text:
+                    streamed_runs.add(event["run_id"])
+                    yield text
+            elif event["event"] == "on_chat_model_end":
+                output = event["data"]["output"]
+                if getattr(output, "tool_calls", None):
+                    # Not the final answer: discard any text this turn streamed
+                    if event["run_id"] in streamed_runs:
+                        yield STREAM_RESET
+                elif event["run_id"] not in streamed_runs:
+                    # Responses served from the LLM cache arrive whole, without stream events
+                    text = self._text_content(output.content)
+                    if text:
+                        yield text
+
+        logger.debug("✅ FINAL ANSWER STREAMED")
+
 
 async def create_acm_agent(openai_api_key: str = None) -> ACMSearchAgent:
     """Create and initialize an ACM search agent"""
+    # Cache identical (prompt, model) requests. For a repeated query only the
+    # first model call hits: later calls include the replayed AIMessage, whose
+    # added usage_metadata changes the prompt. Keep an existing cache so
+    # recreating the agent does not drop it.
+    if get_llm_cache() is None:
+        set_llm_cache(InMemoryCache(maxsize=512))
+
     # Load configuration from environment variables
     config = ACMAgentConfig.from_env()
 
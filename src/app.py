@@ -1,12 +1,29 @@
 import streamlit as st
 import asyncio
+import concurrent.futures
+import logging
 import os
 from dotenv import load_dotenv
-from acm_agent import create_acm_agent
+from acm_agent import STREAM_RESET, create_acm_agent, get_agent_loop
+
+# Use uvloop for the agent's event loops when available (not supported on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 # Load environment variables
 load_dotenv()
 
+# Agent debug output (tool calls, results, prompts) is shown with ACM_LOG_LEVEL=DEBUG
+# ACM_LOG_LEVEL applies to the agent logger only; libraries such as httpx
+# stay at WARNING so they do not log every request. Level names are
+# case-insensitive; unknown names fall back to INFO.
+logging.basicConfig(level=logging.WARNING)
+log_level = os.getenv("ACM_LOG_LEVEL", "INFO").upper()
+logging.getLogger("acm_agent").setLevel(log_level if log_level in logging.getLevelNamesMapping() else "INFO")
+
 # Page configuration
 st.set_page_config(
     page_title="ACM Search Assistant",
@@ -16,47 +33,11 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .stApp {
         background-color: #f8f9fa;
     }
-    .chat-message {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-        display: flex;
-        align-items: flex-start;
-        gap: 0.5rem;
-    }
-    .chat-message.user {
-        background-color: #e3f2fd;
-        border-left: 4px solid #2196f3;
-    }
-    .chat-message.assistant {
-        background-color: #f3e5f5;
-        border-left: 4px solid #9c27b0;
-    }
-    .chat-message .avatar {
-        width: 40px;
-        height: 40px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.2rem;
-        color: white;
-    }
-    .user .avatar {
-        background-color: #2196f3;
-    }
-    .assistant .avatar {
-        background-color: #9c27b0;
-    }
-    .chat-message .content {
-        flex: 1;
-        margin-left: 0.5rem;
-    }
     .sidebar-info {
         background-color: #e8f5e8;
         padding: 1rem;
@@ -72,7 +53,29 @@ st.markdown("""
         margin-bottom: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Sidebar capabilities summary
+SIDEBAR_INFO_HTML = """
+        <div class="sidebar-info">
+            <strong>🎯 What can I help you with?</strong><br><br>
+            • Search ACM clusters and resources<br>
+            • Find policies and applications<br>
+            • Query workloads and deployments<br>
+            • Get cluster status information<br>
+            • Explore ACM configurations
+        </div>
+        """
+
+@st.cache_resource
+def _inject_css():
+    """Inject the custom CSS; cached so the block is serialized once"""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+@st.cache_resource
+def _render_sidebar_info():
+    """Render the sidebar capabilities summary; cached like the CSS"""
+    st.markdown(SIDEBAR_INFO_HTML, unsafe_allow_html=True)
 
 def get_current_user():
     """Get authenticated user info from OAuth proxy headers"""
@@ -107,22 +110,75 @@ def get_current_user():
         print(f"🔄 [AUTH] Using fallback - User: {fallback_user}, Groups: {fallback_groups}")
         return fallback_user, fallback_groups
 
+def run_async(awaitable) -> concurrent.futures.Future:
+    """Schedule an awaitable on the shared event loop"""
+    async def _await():
+        return await awaitable
+    return asyncio.run_coroutine_threadsafe(_await(), get_agent_loop())
+
+def adopt_agent():
+    """Take over the agent being initialized in the background, waiting if still running"""
+    future = st.session_state.get("agent_future")
+    if future is None:
+        return
+
+    if not future.done():
+        with st.spinner("🔧 Initializing ACM Agent..."):
+            concurrent.futures.wait([future])
+    del st.session_state.agent_future
+
+    try:
+        st.session_state.agent = future.result()
+        st.success("✅ ACM Agent initialized successfully!")
+    except Exception as e:
+        st.error(f"❌ Failed to initialize agent: {str(e)}")
+        st.session_state.agent = None
+
+def stream_agent_response(agent, prompt: str):
+    """Bridge the agent's async token stream to a sync generator"""
+    stream = agent.chat_stream(prompt)
+    try:
+        while True:
+            try:
+                yield run_async(stream.__anext__()).result()
+            except StopAsyncIteration:
+                break
+    finally:
+        run_async(stream.aclose()).result()
+
+def render_agent_response(agent, prompt: str) -> str:
+    """Stream the agent's answer into the page and return the final answer text
+
+    Text from model turns that end in tool calls is cleared when the agent
+    yields STREAM_RESET, so only the final answer stays on screen.
+    """
+    chunks = stream_agent_response(agent, prompt)
+    while True:
+        placeholder = st.empty()
+        reset = False
+
+        def turn_tokens():
+            nonlocal reset
+            for chunk in chunks:
+                if chunk is STREAM_RESET:
+                    reset = True
+                    return
+                yield chunk
+
+        with placeholder.container():
+            response = st.write_stream(turn_tokens())
+        if not reset:
+            return response
+        placeholder.empty()
+
 def display_chat_message(role: str, content: str):
-    """Display a chat message with styling"""
-    avatar = "👤" if role == "user" else "🤖"
-    css_class = role
-
-    st.markdown(f"""
-    <div class="chat-message {css_class}">
-        <div class="avatar">{avatar}</div>
-        <div class="content">
-            <strong>{'You' if role == 'user' else 'ACM Assistant'}:</strong><br>
-            {content}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    """Display a chat message using Streamlit's native chat container"""
+    with st.chat_message(role, avatar="👤" if role == "user" else "🤖"):
+        st.markdown(content)
 
 def main():
+    _inject_css()
+
     st.title("🔍 ACM Search Assistant")
     st.markdown("*Your intelligent assistant for Red Hat Advanced Cluster Management*")
 
@@ -154,16 +210,7 @@ def main():
         st.markdown("---")
 
         # Information section
-        st.markdown("""
-        <div class="sidebar-info">
-            <strong>🎯 What can I help you with?</strong><br><br>
-            • Search ACM clusters and resources<br>
-            • Find policies and applications<br>
-            • Query workloads and deployments<br>
-            • Get cluster status information<br>
-            • Explore ACM configurations
-        </div>
-        """, unsafe_allow_html=True)
+        _render_sidebar_info()
 
         st.markdown("---")
 
@@ -191,6 +238,8 @@ def main():
         # Clear chat button
         if st.button("🗑️ Clear Chat", use_container_width=True):
             st.session_state.messages = []
+            if st.session_state.get("agent"):
+                st.session_state.agent.clear_cache()
             st.rerun()
 
     # Initialize session state
@@ -205,19 +254,13 @@ def main():
     has_mcp_config = bool(os.getenv("MCP_SERVER_URL"))
     has_config = has_api_key and has_mcp_config
 
-    # Initialize agent if configuration is available and agent not yet created
+    # Start initializing the agent in the background so the page renders
+    # immediately; it is adopted once ready or when the user first asks something
     if has_config and st.session_state.agent is None:
-        with st.spinner("🔧 Initializing ACM Agent..."):
-            try:
-                # Create agent using environment configuration
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                st.session_state.agent = loop.run_until_complete(create_acm_agent())
-                st.success("✅ ACM Agent initialized successfully!")
-
-            except Exception as e:
-                st.error(f"❌ Failed to initialize agent: {str(e)}")
-                st.session_state.agent = None
+        if "agent_future" not in st.session_state:
+            st.session_state.agent_future = run_async(create_acm_agent())
+        if st.session_state.agent_future.done():
+            adopt_agent()
 
     # Chat interface
     if has_config:
@@ -234,18 +277,20 @@ def main():
             st.session_state.messages.append({"role": "user", "content": prompt})
             display_chat_message("user", prompt)
 
+            # Wait for a background initialization still in progress
+            if st.session_state.agent is None:
+                adopt_agent()
+
             # Get agent response
             if st.session_state.agent:
                 with st.spinner("🤔 Thinking..."):
                     try:
-                        # Get response from agent
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        response = loop.run_until_complete(st.session_state.agent.chat(prompt))
+                        # Stream response from agent as it is generated
+                        with st.chat_message("assistant", avatar="🤖"):
+                            response = render_agent_response(st.session_state.agent, prompt)
 
                         # Add assistant response to history
                         st.session_state.messages.append({"role": "assistant", "content": response})
-                        display_chat_message("assistant", response)
 
                     except Exception as e:
                         error_message = f"❌ Error: {str(e)}"
@@ -289,18 +334,20 @@ def main():
                 st.session_state.messages.append({"role": "user", "content": example_query})
                 display_chat_message("user", example_query)
 
+                # Wait for a background initialization still in progress
+                if st.session_state.agent is None:
+                    adopt_agent()
+
                 # Process with agent
                 if st.session_state.agent:
                     with st.spinner("🤔 Thinking..."):
                         try:
-                            # Get response from agent
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            response = loop.run_until_complete(st.session_state.agent.chat(example_query))
+                            # Stream response from agent as it is generated
+                            with st.chat_message("assistant", avatar="🤖"):
+                                response = render_agent_response(st.session_state.agent, example_query)
 
                             # Add assistant response to history
                             st.session_state.messages.append({"role": "assistant", "content": response})
-                            display_chat_message("assistant", response)
 
                         except Exception as e:
                             error_message = f"❌ Error: {str(e)}"